@@ -46,6 +46,8 @@ class GFApplication(QApplication):
         super().__init__(argv)
         self.setObjectName("GFApplication")
 
+        checkPySide6Version()
+
         if not bootScriptPath and argv:
             bootScriptPath = argv[0]
 
@@ -321,6 +323,7 @@ class GFApplication(QApplication):
 
     def applyLanguagePref(self):
         from gitfourchette import settings
+        from gitfourchette.globalshortcuts import GlobalShortcuts
         from gitfourchette.trtables import TrTables
         from gitfourchette.tasks.taskbook import TaskBook
 
@@ -329,6 +332,7 @@ class GFApplication(QApplication):
         # Regenerate rosetta stones
         TrTables.retranslate()
         TaskBook.retranslate()
+        GlobalShortcuts.retranslate()
 
     def applyQtStylePref(self, forceApplyDefault: bool):
         from gitfourchette import settings
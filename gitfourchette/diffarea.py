@@ -5,8 +5,7 @@
 # -----------------------------------------------------------------------------
 
 import logging
-import typing
-from typing import Literal
+from typing import Literal, get_args
 
 from gitfourchette.diffview.diffview import DiffView
 from gitfourchette.diffview.specialdiffview import SpecialDiffView
@@ -26,6 +25,12 @@ from gitfourchette.toolbox import *
 FileStackPage = Literal["workdir", "commit"]
 DiffStackPage = Literal["text", "special", "conflict"]
 
+# Page names in stacked widget order, and the reverse mapping (resolved once at import time)
+FILE_STACK_PAGES: tuple[FileStackPage, ...] = get_args(FileStackPage)
+DIFF_STACK_PAGES: tuple[DiffStackPage, ...] = get_args(DiffStackPage)
+FILE_STACK_INDICES = {page: i for i, page in enumerate(FILE_STACK_PAGES)}
+DIFF_STACK_INDICES = {page: i for i, page in enumerate(DIFF_STACK_PAGES)}
+
 FILEHEADER_HEIGHT = 24
 
 logger = logging.getLogger(__name__)
@@ -43,6 +48,13 @@ def gridPadding():
     return QSpacerItem(3, 1, QSizePolicy.Policy.Fixed)
 
 
+def tightLayout(layout: QLayout, spacing=0):
+    # Zero spacing also gets us automatic frameless list views on KDE Plasma 6 Breeze
+    layout.setContentsMargins(QMargins())
+    layout.setSpacing(spacing)
+    return layout
+
+
 class DiffArea(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
@@ -60,9 +72,7 @@ class DiffArea(QWidget):
         diffBanner.setProperty("class", "diff")
         diffBanner.setVisible(False)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(QMargins())
-        layout.setSpacing(0)
+        layout = tightLayout(QVBoxLayout(self))
         layout.addWidget(contextHeader)
         layout.addWidget(diffBanner)
         layout.addWidget(FaintSeparator(self))
@@ -79,6 +89,11 @@ class DiffArea(QWidget):
         self.diffBanner = diffBanner
         self.contextHeader = contextHeader
 
+        self._fileListsByContext = {
+            NavContext.STAGED: self.stagedFiles,
+            NavContext.UNSTAGED: self.dirtyFiles,
+        }
+
         for passiveWidget in (
                 self.diffHeader,
                 self.committedHeader,
@@ -130,16 +145,14 @@ class DiffArea(QWidget):
         appendShortcutToToolTip(discardButton, GlobalShortcuts.discardHotkeys[0])
 
         container = QWidget()
-        layout = QGridLayout(container)
-        layout.setSpacing(0)  # automatic frameless list views on KDE Plasma 6 Breeze
-        layout.setContentsMargins(QMargins())
+        layout = tightLayout(QGridLayout(container))
         # Row 0
         layout.addItem(gridPadding(),           0, 0)
         layout.addWidget(header,                0, 1)
         layout.addWidget(stageButton,           0, 2)
         layout.addWidget(discardButton,         0, 3)
         # Row 1
-        layout.addItem(QSpacerItem(1, 1),       1, 0, 1, 4)
+        layout.setRowMinimumHeight(1, 1)
         # Row 2
         layout.addWidget(dirtyFiles.searchBar,  2, 0, 1, 4)
         # Row 3
@@ -148,8 +161,8 @@ class DiffArea(QWidget):
 
         stageButton.clicked.connect(dirtyFiles.stage)
         discardButton.clicked.connect(dirtyFiles.discard)
-        dirtyFiles.selectedCountChanged.connect(lambda n: stageButton.setEnabled(n > 0))
-        dirtyFiles.selectedCountChanged.connect(lambda n: discardButton.setEnabled(n > 0))
+        dirtyFiles.selectionStateUpdated.connect(stageButton.setEnabled)
+        dirtyFiles.selectionStateUpdated.connect(discardButton.setEnabled)
 
         self.dirtyFiles = dirtyFiles
         self.dirtyHeader = header
@@ -187,7 +200,7 @@ class DiffArea(QWidget):
 
         # Connect signals
         unstageButton.clicked.connect(stagedFiles.unstage)
-        stagedFiles.selectedCountChanged.connect(lambda n: unstageButton.setEnabled(n > 0))
+        stagedFiles.selectionStateUpdated.connect(unstageButton.setEnabled)
 
         commitButton.clicked.connect(lambda: NewCommit.invoke(self))
         commitButtonMenu = ActionDef.makeQMenu(
@@ -204,15 +217,13 @@ class DiffArea(QWidget):
 
         # Lay out container
         container = QWidget()
-        layout = QGridLayout(container)
-        layout.setContentsMargins(QMargins())
-        layout.setSpacing(0)  # automatic frameless list views on KDE Plasma 6 Breeze
+        layout = tightLayout(QGridLayout(container))
         # Row 0
         layout.addItem(gridPadding(),           0, 0)
         layout.addWidget(header,                0, 1)
         layout.addWidget(unstageButton,         0, 2)
         # Row 1
-        layout.addItem(QSpacerItem(1, 1),       1, 0)
+        layout.setRowMinimumHeight(1, 1)
         # Row 2
         layout.addWidget(stagedFiles.searchBar, 2, 0, 1, 3)  # row col rowspan colspan
         layout.addWidget(stagedFiles,           3, 0, 1, 3)
@@ -236,14 +247,12 @@ class DiffArea(QWidget):
         header.setEnabled(False)
 
         container = QWidget()
-        layout = QGridLayout(container)
-        layout.setContentsMargins(QMargins())
-        layout.setSpacing(0)  # automatic frameless list views on KDE Plasma 6 Breeze
+        layout = tightLayout(QGridLayout(container))
         layout.addItem(gridPadding(),               0, 0)
         layout.addWidget(header,                    0, 1)
         layout.addItem(gridPadding(),               0, 2)
         layout.addWidget(committedFiles.searchBar,  1, 0, 1, 3)
-        layout.addItem(QSpacerItem(1, 1),           2, 0, 1, 3)
+        layout.setRowMinimumHeight(2, 1)
         layout.addWidget(committedFiles,            3, 0, 1, 3)
 
         self.committedFiles = committedFiles
@@ -258,17 +267,10 @@ class DiffArea(QWidget):
         # Don't let header dictate window width if displaying long filename
         header.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Minimum)
 
-        topContainer = QWidget()
-        topLayout = QHBoxLayout(topContainer)
-        topLayout.setContentsMargins(0, 0, 0, 0)
-        topLayout.addWidget(header)
-
         diff = DiffView()
 
         diffViewContainer = QWidget()
-        diffViewContainerLayout = QVBoxLayout(diffViewContainer)
-        diffViewContainerLayout.setSpacing(0)
-        diffViewContainerLayout.setContentsMargins(0, 0, 0, 0)
+        diffViewContainerLayout = tightLayout(QVBoxLayout(diffViewContainer))
         diffViewContainerLayout.addWidget(diff.searchBar)
         diffViewContainerLayout.addWidget(diff)
 
@@ -287,10 +289,8 @@ class DiffArea(QWidget):
         stack.setCurrentIndex(0)
 
         stackContainer = QWidget()
-        layout = QVBoxLayout(stackContainer)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(1)
-        layout.addWidget(topContainer)
+        layout = tightLayout(QVBoxLayout(stackContainer), spacing=1)
+        layout.addWidget(header)
         layout.addWidget(stack)
 
         self.diffHeader = header
@@ -338,13 +338,21 @@ class DiffArea(QWidget):
             raise NotImplementedError(f"Unknown FileStackPage {page}")
 
         numWidgets = len(widgets)
-        selections = [w.selectedIndexes() for w in widgets]
-        lengths = [w.model().rowCount() for w in widgets]
+        hasSelections = []
+        lengths = []
+        for w in widgets:
+            hasSelections.append(w.selectionModel().hasSelection())
+            lengths.append(w.model().rowCount())
+
+        # nothing to navigate to (e.g. clean workdir)
+        if not any(lengths):
+            QApplication.beep()
+            return
 
         # find widget to start from: topmost widget that has any selection
         leader = -1
-        for i, selection in enumerate(selections):
-            if selection:
+        for i, hasSelection in enumerate(hasSelections):
+            if hasSelection:
                 leader = i
                 break
 
@@ -355,8 +363,12 @@ class DiffArea(QWidget):
             while (leader < numWidgets) and (lengths[leader] == 0):
                 leader += 1
         else:
-            # get selected row in leader widget - TODO: this may not be accurate when multiple rows are selected
-            row = selections[leader][-1].row()
+            # get current row in leader widget (cheaper than converting the whole selection to a list)
+            current = widgets[leader].currentIndex()
+            if current.isValid():
+                row = current.row()
+            else:
+                row = widgets[leader].selectedIndexes()[-1].row()
 
             if down:
                 row += 1
@@ -383,18 +395,13 @@ class DiffArea(QWidget):
             QApplication.beep()
 
             # Focus on the widget that has some selected files in it
-            for w in widgets:
-                if len(w.selectedIndexes()) > 0:
+            for w, hasSelection in zip(widgets, hasSelections, strict=True):
+                if hasSelection:
                     w.setFocus()
                     break
 
     def fileListByContext(self, context: NavContext) -> FileList:
-        if context == NavContext.STAGED:
-            return self.stagedFiles
-        elif context == NavContext.UNSTAGED:
-            return self.dirtyFiles
-        else:
-            return self.committedFiles
+        return self._fileListsByContext.get(context, self.committedFiles)
 
     def setUpForLocator(self, locator: NavLocator) -> NavLocator:
         """
@@ -444,7 +451,9 @@ class DiffArea(QWidget):
     # -------------------------------------------------------------------------
     # Clear
 
+    @DisableWidgetUpdatesContext.methodDecorator
     def clear(self):
+        # Repaint the file lists and the diff page in a single pass once everything is cleared
         with QSignalBlockerContext(self.committedFiles, self.dirtyFiles, self.stagedFiles):
             self.committedFiles.clear()
             self.dirtyFiles.clear()
@@ -474,26 +483,18 @@ class DiffArea(QWidget):
     # -------------------------------------------------------------------------
     # Stacked widget helpers
 
-    @property
-    def _fileStackPageValues(self):
-        return typing.get_args(FileStackPage)
-
     def fileStackPage(self) -> FileStackPage:
-        return self._fileStackPageValues[self.fileStack.currentIndex()]
+        return FILE_STACK_PAGES[self.fileStack.currentIndex()]
 
     def setFileStackPage(self, p: FileStackPage):
-        self.fileStack.setCurrentIndex(self._fileStackPageValues.index(p))
+        self.fileStack.setCurrentIndex(FILE_STACK_INDICES[p])
 
     def setFileStackPageByContext(self, context: NavContext):
         page: FileStackPage = "workdir" if context.isWorkdir() else "commit"
         self.setFileStackPage(page)
 
-    @property
-    def _diffStackPageValues(self):
-        return typing.get_args(DiffStackPage)
-
     def diffStackPage(self) -> DiffStackPage:
-        return self._diffStackPageValues[self.diffStack.currentIndex()]
+        return DIFF_STACK_PAGES[self.diffStack.currentIndex()]
 
     def setDiffStackPage(self, p: DiffStackPage):
-        self.diffStack.setCurrentIndex(self._diffStackPageValues.index(p))
+        self.diffStack.setCurrentIndex(DIFF_STACK_INDICES[p])
@@ -24,11 +24,15 @@ class DiffGutter(QWidget):
 
     diffView: DiffView
     paddingString: str
+    cachedWidth: int
+    cachedColors: tuple[QColor, QColor, QColor] | None
 
     def __init__(self, parent):
         super().__init__(parent)
         self.diffView = parent
         self.paddingString = ""
+        self.cachedWidth = -1
+        self.cachedColors = None
 
         cursorDpr = 1 if FREEDESKTOP else 4  # On Linux, Qt doesn't seem to support cursors at non-1 DPR
         cursorPix = QPixmap(f"assets:icons/right_ptr@{cursorDpr}x")
@@ -44,10 +48,41 @@ class DiffGutter(QWidget):
             maxDigits = 0
         else:
             maxDigits = len(str(lineNumber))
-        self.paddingString = "0" * (2 * maxDigits + 2)
+        paddingString = "0" * (2 * maxDigits + 2)
+        if paddingString != self.paddingString:
+            self.paddingString = paddingString
+            self.cachedWidth = -1
 
     def calcWidth(self) -> int:
-        return self.fontMetrics().horizontalAdvance(self.paddingString)
+        # Measuring text is relatively expensive and this gets called on every resize/font refresh
+        if self.cachedWidth < 0:
+            self.cachedWidth = self.fontMetrics().horizontalAdvance(self.paddingString)
+        return self.cachedWidth
+
+    def changeEvent(self, event: QEvent):
+        eventType = event.type()
+        if eventType == QEvent.Type.FontChange:
+            self.cachedWidth = -1
+        elif eventType == QEvent.Type.PaletteChange:
+            self.cachedColors = None
+        super().changeEvent(event)
+
+    def gutterColors(self) -> tuple[QColor, QColor, QColor]:
+        """ Return background, line and text colors derived from the current palette. """
+        if self.cachedColors is None:
+            palette = self.palette()
+            themeBG = palette.color(QPalette.ColorRole.Base)  # standard theme background color
+            themeFG = palette.color(QPalette.ColorRole.Text)  # standard theme foreground color
+            if isDarkTheme(palette):
+                gutterColor = themeBG.darker(105)  # light theme
+            else:
+                gutterColor = themeBG.lighter(140)  # dark theme
+            lineColor = QColor(themeFG)
+            lineColor.setAlpha(80)
+            textColor = QColor(themeFG)
+            textColor.setAlpha(128)
+            self.cachedColors = gutterColor, lineColor, textColor
+        return self.cachedColors
 
     def onParentUpdateRequest(self, rect: QRect, dy: int):
         if dy != 0:
@@ -87,15 +122,7 @@ class DiffGutter(QWidget):
         painter.setFont(self.font())
 
         # Set up colors
-        palette = self.palette()
-        themeBG = palette.color(QPalette.ColorRole.Base)  # standard theme background color
-        themeFG = palette.color(QPalette.ColorRole.Text)  # standard theme foreground color
-        if isDarkTheme(palette):
-            gutterColor = themeBG.darker(105)  # light theme
-        else:
-            gutterColor = themeBG.lighter(140)  # dark theme
-        lineColor = QColor(*themeFG.getRgb()[:3], 80)
-        textColor = QColor(*themeFG.getRgb()[:3], 128)
+        gutterColor, lineColor, textColor = self.gutterColors()
 
         # Gather some metrics
         paintRect = event.rect()
@@ -132,20 +159,30 @@ class DiffGutter(QWidget):
         textPen = QPen(textColor)
         painter.setPen(textPen)
 
-        while block.isValid() and top <= paintRect.bottom():
-            if blockNumber >= len(diffView.lineData):
+        # Loop invariants
+        lineData = diffView.lineData
+        numLines = len(lineData)
+        paintTop = paintRect.top()
+        paintBottom = paintRect.bottom()
+        colW = (rightEdge - 3) // 2
+        alignRight = Qt.AlignmentFlag.AlignRight
+        drawText = painter.drawText
+        blockBoundingRect = diffView.blockBoundingRect
+
+        while block.isValid() and top <= paintBottom:
+            if blockNumber >= numLines:
                 break
 
-            ld = diffView.lineData[blockNumber]
-            if block.isVisible() and bottom >= paintRect.top():
-                if ld.diffLine:
+            ld = lineData[blockNumber]
+            if block.isVisible() and bottom >= paintTop:
+                diffLine = ld.diffLine
+                if diffLine:
                     # Draw line numbers
-                    old = str(ld.diffLine.old_lineno) if ld.diffLine.old_lineno > 0 else noOldPlaceholder
-                    new = str(ld.diffLine.new_lineno) if ld.diffLine.new_lineno > 0 else noNewPlaceholder
+                    old = str(diffLine.old_lineno) if diffLine.old_lineno > 0 else noOldPlaceholder
+                    new = str(diffLine.new_lineno) if diffLine.new_lineno > 0 else noNewPlaceholder
 
-                    colW = (rightEdge - 3) // 2
-                    painter.drawText(0, top, colW, fontHeight, Qt.AlignmentFlag.AlignRight, old)
-                    painter.drawText(colW, top, colW, fontHeight, Qt.AlignmentFlag.AlignRight, new)
+                    drawText(0, top, colW, fontHeight, alignRight, old)
+                    drawText(colW, top, colW, fontHeight, alignRight, new)
                 else:
                     # Draw hunk separator horizontal line
                     y = round((top + bottom) / 2)
@@ -155,7 +192,7 @@ class DiffGutter(QWidget):
 
             block = block.next()
             top = bottom
-            bottom = top + round(diffView.blockBoundingRect(block).height())
+            bottom = top + round(blockBoundingRect(block).height())
             blockNumber += 1
 
         painter.end()
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import logging
 import os
-import re
+from array import array
 from bisect import bisect_left, bisect_right
+from operator import attrgetter
 
 from gitfourchette import colors
 from gitfourchette import settings
@@ -38,26 +39,47 @@ class DiffSearchHighlighter(QSyntaxHighlighter):
         self.highlightFormat.setBackground(colors.yellow)
         self.highlightFormat.setFontWeight(QFont.Weight.Bold)
 
-    def highlightBlock(self, text: str):
-        searchBar = self.parent().searchBar
-        if not searchBar.isVisible():
+        self.searchTerm = ""
+        self.targetDocument = None
+
+    def bindToDocument(self, document: QTextDocument):
+        """
+        Set the document to highlight search terms in.
+        The highlighter only attaches to it while there's a search term, so that Qt
+        doesn't run highlightBlock over every block of every new document for nothing.
+        """
+        self.targetDocument = document
+        self.setDocument(document if self.searchTerm else None)
+
+    def setSearchTerm(self, term: str):
+        """ Set the (lowercase) term to highlight; rehighlight the document only if it has changed. """
+        if term == self.searchTerm:
+            return
+        self.searchTerm = term
+        if not term:
+            self.setDocument(None)  # detaching clears the highlights
             return
+        if self.document() is not self.targetDocument:
+            self.setDocument(self.targetDocument)
+        self.rehighlight()
 
-        term = searchBar.searchTerm
+    def highlightBlock(self, text: str):
+        term = self.searchTerm
         if not term:
             return
         termLength = len(term)
 
+        # Most blocks don't contain the term at all; bail before entering the loop
         text = text.lower()
-        textLength = len(text)
+        index = text.find(term)
+        if index < 0:
+            return
 
-        index = 0
-        while index < textLength:
-            index = text.find(term, index)
-            if index < 0:
-                break
-            self.setFormat(index, termLength, self.highlightFormat)
-            index += termLength
+        setFormat = self.setFormat
+        highlightFormat = self.highlightFormat
+        while index >= 0:
+            setFormat(index, termLength, highlightFormat)
+            index = text.find(term, index + termLength)
 
 
 class DiffView(QPlainTextEdit):
@@ -67,11 +89,11 @@ class DiffView(QPlainTextEdit):
     selectionActionable = Signal(bool)
 
     lineData: list[LineData]
-    lineCursorStartCache: list[int]
-    lineHunkIDCache: list[int]
+    lineCursorStartCache: array[int]
+    lineHunkIDCache: array[int]
+    maxPosition: int
     currentLocator: NavLocator
     currentPatch: Patch | None
-    currentWorkdirFileStat: os.stat_result | None
     repo: Repo | None
     isDetachedWindow: bool
 
@@ -83,8 +105,9 @@ class DiffView(QPlainTextEdit):
 
         # First-time init so callbacks don't crash looking for missing attributes
         self.lineData = []
-        self.lineCursorStartCache = []
-        self.lineHunkIDCache = []
+        self.lineCursorStartCache = array("q")
+        self.lineHunkIDCache = array("i")
+        self.maxPosition = 0
         self.currentLocator = NavLocator()
         self.currentPatch = None
         self.repo = None
@@ -107,10 +130,10 @@ class DiffView(QPlainTextEdit):
 
         self.searchBar = SearchBar(self, self.tr("Find in Diff"))
         # self.searchBar.textChanged.connect(self.onSearchTextChanged)
-        self.searchBar.textChanged.connect(self.highlighter.rehighlight)
+        self.searchBar.textChanged.connect(self.refreshSearchHighlight)
         self.searchBar.searchNext.connect(lambda: self.search(SearchBar.Op.NEXT))
         self.searchBar.searchPrevious.connect(lambda: self.search(SearchBar.Op.PREVIOUS))
-        self.searchBar.visibilityChanged.connect(lambda: self.highlighter.rehighlight())
+        self.searchBar.visibilityChanged.connect(self.refreshSearchHighlight)
         self.searchBar.hide()
 
         self.rubberBand = DiffRubberBand(self.viewport())
@@ -251,6 +274,7 @@ class DiffView(QPlainTextEdit):
 
         # Clear the actual contents
         super().clear()
+        self.maxPosition = 0
 
     def replaceDocument(self, repo: Repo, patch: Patch, locator: NavLocator, newDoc: DiffDocument):
         oldDocument = self.document()
@@ -279,11 +303,16 @@ class DiffView(QPlainTextEdit):
 
         newDoc.document.setParent(self)
         self.setDocument(newDoc.document)
-        self.highlighter.setDocument(newDoc.document)
+        self.highlighter.bindToDocument(newDoc.document)
 
         self.lineData = newDoc.lineData
-        self.lineCursorStartCache = [ld.cursorStart for ld in self.lineData]
-        self.lineHunkIDCache = [ld.hunkPos.hunkID for ld in self.lineData]
+        # Unboxed lookup tables for bisection (built in C via map/attrgetter)
+        self.lineCursorStartCache = array("q", map(attrgetter("cursorStart"), self.lineData))
+        self.lineHunkIDCache = array("i", map(attrgetter("hunkPos.hunkID"), self.lineData))
+
+        # The document is read-only, so its end position won't change until the next replaceDocument
+        lastBlock = newDoc.document.lastBlock()
+        self.maxPosition = lastBlock.position() + max(0, lastBlock.length() - 1)
 
         # now reset defaults that are lost when changing documents
         self.refreshPrefs()
@@ -321,6 +350,10 @@ class DiffView(QPlainTextEdit):
         if not self.currentLocator.isSimilarEnoughTo(newLocator):
             return False
 
+        # Changing amount of context lines? (Cheap test: do it before accessing pygit2 deltas)
+        if len(newDocument.lineData) != len(self.lineData):
+            return False
+
         of1: DiffFile = self.currentPatch.delta.old_file
         nf1: DiffFile = self.currentPatch.delta.new_file
         of2: DiffFile = newPatch.delta.old_file
@@ -332,10 +365,6 @@ class DiffView(QPlainTextEdit):
         if not DiffFile_compare(nf1, nf2):
             return False
 
-        # Changing amount of context lines?
-        if len(newDocument.lineData) != len(self.lineData):
-            return False
-
         # All IDs must be valid
         assert of1.flags & DiffFlag.VALID_ID
         assert nf1.flags & DiffFlag.VALID_ID
@@ -376,13 +405,25 @@ class DiffView(QPlainTextEdit):
             topCursor.setPosition(locator.diffScrollTop)
             self.setTextCursor(topCursor)
             self.centerCursor()
-            scrolls = 0
             corner = self.getStableTopLeftCorner()
-            while scrolls < 500 and self.cursorForPosition(corner).position() < locator.diffScrollTop:
-                scrolls += 1
-                scrollTo = vsb.value() + 1
-                vsb.setValue(scrollTo)
-            # logger.info(f"Stabilized in {scrolls} iterations - final scroll {scrollTo} vs {locator.diffScroll})"
+
+            def topPosition(value: int) -> int:
+                vsb.setValue(value)
+                return self.cursorForPosition(corner).position()
+
+            # Find the smallest scrollbar value (up to 500 steps down) that brings diffScrollTop to the top.
+            # The top position grows monotonically with the scrollbar value, so bisect rather than stepping.
+            low = vsb.value()
+            if topPosition(low) < locator.diffScrollTop:
+                high = min(low + 500, vsb.maximum())
+                while low + 1 < high:
+                    mid = (low + high) // 2
+                    if topPosition(mid) < locator.diffScrollTop:
+                        low = mid
+                    else:
+                        high = mid
+                scrollTo = high
+            # logger.info(f"Stabilized at scroll {scrollTo} vs {locator.diffScroll})"
             #               f" - char pos {self.cursorForPosition(corner).position()} vs {locator.diffScrollTop}")
 
         # Move text cursor
@@ -469,8 +510,13 @@ class DiffView(QPlainTextEdit):
         shortHunkHeader = ""
         if clickedHunkID >= 0:
             hunk: DiffHunk = self.currentPatch.hunks[clickedHunkID]
-            headerMatch = re.match(r"@@ ([^@]+) @@.*", hunk.header)
-            shortHunkHeader = headerMatch.group(1) if headerMatch else f"#{clickedHunkID}"
+            # Extract the line ranges from "@@ -a,b +c,d @@ ..."
+            header = hunk.header
+            rangesEnd = header.find(" @@", 3)
+            if header.startswith("@@ ") and rangesEnd > 3 and "@" not in header[3:rangesEnd]:
+                shortHunkHeader = header[3:rangesEnd]
+            else:
+                shortHunkHeader = f"#{clickedHunkID}"
 
         actions = []
 
@@ -617,9 +663,11 @@ class DiffView(QPlainTextEdit):
         start, end = self.getSelectedLineExtents()
         if start < 0:
             return False
+        # Only +/- lines belong to a clump. Testing clumpID is much cheaper
+        # than querying pygit2 for each line's origin.
+        lineData = self.lineData
         for i in range(start, end+1):
-            ld = self.lineData[i]
-            if ld.diffLine and ld.diffLine.origin in "+-":
+            if lineData[i].clumpID >= 0:
                 return True
         return False
 
@@ -796,8 +844,7 @@ class DiffView(QPlainTextEdit):
     # Cursor/selection
 
     def getMaxPosition(self):
-        lastBlock = self.document().lastBlock()
-        return lastBlock.position() + max(0, lastBlock.length() - 1)
+        return self.maxPosition
 
     def getAnchorHomeLinePosition(self):
         cursor: QTextCursor = self.textCursor()
@@ -832,6 +879,8 @@ class DiffView(QPlainTextEdit):
         clickedPosition = self.getStartOfLineAt(point)
 
         cursor: QTextCursor = self.textCursor()
+        oldAnchor = cursor.anchor()
+        oldPosition = cursor.position()
 
         if homeLinePosition <= clickedPosition:
             # Move anchor to START of home line
@@ -847,6 +896,10 @@ class DiffView(QPlainTextEdit):
             cursor.setPosition(clickedPosition, QTextCursor.MoveMode.KeepAnchor)
             cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
 
+        # Dragging within the same line keeps producing the same selection - don't repaint for nothing
+        if cursor.anchor() == oldAnchor and cursor.position() == oldPosition:
+            return
+
         self.replaceCursor(cursor)
 
     def selectClumpOfLinesAt(self, clickPoint: QPoint = None, textCursorPosition: int = -1):
@@ -861,9 +914,7 @@ class DiffView(QPlainTextEdit):
         if ld.hunkPos.hunkLineNum < 0:
             # Hunk header line, select whole hunk
             start = i
-            end = i
-            while end < len(ldList)-1 and ldList[end+1].hunkPos.hunkID == ld.hunkPos.hunkID:
-                end += 1
+            end = bisect_left(self.lineHunkIDCache, ld.hunkPos.hunkID + 1, i) - 1
         elif ld.clumpID < 0:
             # Context line
             QApplication.beep()
@@ -888,8 +939,10 @@ class DiffView(QPlainTextEdit):
     # ---------------------------------------------
     # Selection help
 
+    @CallbackAccumulator.deferredMethod  # cursorPositionChanged and selectionChanged often fire together
     def emitSelectionHelp(self):
-        if self.currentLocator.context in [NavContext.COMMITTED, NavContext.EMPTY]:
+        context = self.currentLocator.context
+        if context in [NavContext.COMMITTED, NavContext.EMPTY]:
             return
 
         if not self.isSelectionActionable():
@@ -897,26 +950,28 @@ class DiffView(QPlainTextEdit):
             self.selectionActionable.emit(False)
             return
 
+        # No help text outside of the staging contexts, so don't bother measuring the selection
+        if context not in [NavContext.UNSTAGED, NavContext.STAGED]:
+            return
+
         start, end = self.getSelectedLineExtents()
         numLines = end - start + 1
 
-        if self.currentLocator.context == NavContext.UNSTAGED:
+        if context == NavContext.UNSTAGED:
             if numLines <= 1:
                 help = self.tr("Hit {stagekey} to stage the current line, or {discardkey} to discard it.")
             else:
                 help = self.tr("Hit {stagekey} to stage the selected lines, or {discardkey} to discard them.")
-        elif self.currentLocator.context == NavContext.STAGED:
+        else:
             if numLines <= 1:
                 help = self.tr("Hit {unstagekey} to unstage the current line.")
             else:
                 help = self.tr("Hit {unstagekey} to unstage the selected lines.")
-        else:
-            return
 
         help = help.format(
-            stagekey=QKeySequence(GlobalShortcuts.stageHotkeys[0]).toString(QKeySequence.SequenceFormat.NativeText),
-            unstagekey=QKeySequence(GlobalShortcuts.discardHotkeys[0]).toString(QKeySequence.SequenceFormat.NativeText),
-            discardkey=QKeySequence(GlobalShortcuts.discardHotkeys[0]).toString(QKeySequence.SequenceFormat.NativeText))
+            stagekey=GlobalShortcuts.stageKeyName,
+            unstagekey=GlobalShortcuts.discardKeyName,
+            discardkey=GlobalShortcuts.discardKeyName)
 
         self.contextualHelp.emit(help)
         self.selectionActionable.emit(True)
@@ -924,6 +979,10 @@ class DiffView(QPlainTextEdit):
     # ---------------------------------------------
     # Search
 
+    def refreshSearchHighlight(self):
+        term = self.searchBar.searchTerm if self.searchBar.isVisible() else ""
+        self.highlighter.setSearchTerm(term)
+
     def search(self, op: SearchBar.Op):
         assert isinstance(op, SearchBar.Op)
         self.searchBar.popUp(forceSelectAll=op == SearchBar.Op.START)
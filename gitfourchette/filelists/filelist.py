@@ -89,7 +89,7 @@ class FileListDelegate(QStyledItemDelegate):
 
 class FileList(QListView):
     nothingClicked = Signal()
-    selectedCountChanged = Signal(int)
+    selectionStateUpdated = Signal(bool)
     openDiffInNewWindow = Signal(Patch, NavLocator)
     openSubRepo = Signal(str)
     statusMessage = Signal(str)
@@ -437,7 +437,8 @@ class FileList(QListView):
             else:
                 current = None
 
-        self.selectedCountChanged.emit(numSelectedTotal)
+        # Emitted on every selection change: True if anything is selected
+        self.selectionStateUpdated.emit(numSelectedTotal > 0)
 
         if current and current.isValid():
             locator = self.getNavLocatorForIndex(current)
@@ -4,6 +4,7 @@
 # For full terms, see the included LICENSE file.
 # -----------------------------------------------------------------------------
 
+import functools
 import sys
 from textwrap import dedent
 
@@ -17,8 +18,9 @@ WEBSITE_URL = "https://gitfourchette.org"
 DONATE_URL = "https://ko-fi.com/jorio"
 
 
-def getPygit2FeatureStrings():
-    return [f.name.lower() for f in pygit2.enums.Feature if f & pygit2.features]
+@functools.lru_cache(maxsize=1)
+def getPygit2FeatureStrings() -> tuple[str, ...]:
+    return tuple(f.name.lower() for f in pygit2.enums.Feature if f & pygit2.features)
 
 
 def simpleLink(url):
@@ -21,6 +21,10 @@ class GlobalShortcuts:
     checkoutCommitFromGraphHotkeys = [Qt.Key.Key_Return, Qt.Key.Key_Enter]
     getCommitInfoHotkeys = [Qt.Key.Key_Space]
 
+    # Native names of the first stage/discard hotkeys, for use in help text
+    stageKeyName = ""
+    discardKeyName = ""
+
     _initialized = False
 
     @classmethod
@@ -36,4 +40,13 @@ class GlobalShortcuts:
         cls.closeTab = makeMultiShortcut(QKeySequence.StandardKey.Close)
         cls.openRepoFolder = makeMultiShortcut("Ctrl+Shift+O")
 
+        cls.retranslate()
+
         cls._initialized = True
+
+    @classmethod
+    def retranslate(cls):
+        """ Refresh the native key names (they depend on the current translator) """
+        nativeText = QKeySequence.SequenceFormat.NativeText
+        cls.stageKeyName = QKeySequence(cls.stageHotkeys[0]).toString(nativeText)
+        cls.discardKeyName = QKeySequence(cls.discardHotkeys[0]).toString(nativeText)
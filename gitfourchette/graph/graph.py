@@ -455,10 +455,9 @@ class Frame:
 
     @staticmethod
     def reserveArcListCapacity(theList, newLength):
-        if len(theList) >= newLength:
-            return
-        for _ in range(newLength - len(theList)):
-            theList.append(None)
+        shortfall = newLength - len(theList)
+        if shortfall > 0:
+            theList.extend([None] * shortfall)
 
     @staticmethod
     def cleanUpArcList(theList: list[Arc | None], olderThanRow: BatchRow, alsoTrimBack: bool = True):
@@ -8,7 +8,7 @@ import math
 
 from gitfourchette import settings
 from gitfourchette.forms.searchbar import SearchBar
-from gitfourchette.graphview.commitlogmodel import CommitLogModel, SpecialRow, CommitToolTipZone
+from gitfourchette.graphview.commitlogmodel import CommitLogModel, SpecialRow, CommitToolTipZone, trimCacheDict
 from gitfourchette.graphview.graphpaint import paintGraphFrame
 from gitfourchette.porcelain import *
 from gitfourchette.qt import *
@@ -56,6 +56,9 @@ XSPACING = 6
 
 NARROW_WIDTH = (500, 750)
 
+DATE_TEXT_CACHE_SIZE = 500
+SUMMARY_CACHE_SIZE = 500
+
 
 class CommitLogDelegate(QStyledItemDelegate):
     def __init__(self, repoWidget, parent=None):
@@ -70,6 +73,10 @@ class CommitLogDelegate(QStyledItemDelegate):
         self.uncommittedFont = QFont()
         self.refboxFont = QFont()
         self.homeRefboxFont = QFont()
+        self.dateTextCache: dict[int, str] = {}
+        self.summaryCache: dict[Oid, str] = {}
+        self.sizeHintCache = QSize()
+        self.sizeHintCacheKey = (-1, -1)
 
     def invalidateMetrics(self):
         self.mustRefreshMetrics = True
@@ -80,6 +87,9 @@ class CommitLogDelegate(QStyledItemDelegate):
 
         self.mustRefreshMetrics = False
 
+        # Date format or locale may have changed
+        self.dateTextCache.clear()
+
         self.hashCharWidth = max(option.fontMetrics.horizontalAdvance(c) for c in "0123456789abcdef")
 
         self.activeCommitFont = QFont(option.font)
@@ -104,6 +114,33 @@ class CommitLogDelegate(QStyledItemDelegate):
     def repoModel(self) -> RepoModel:
         return self.repoWidget.repoModel
 
+    def formatDate(self, secsSinceEpoch: int, locale: QLocale) -> str:
+        """ Format a commit timestamp in the user's short date format, cached by timestamp """
+        try:
+            return self.dateTextCache[secsSinceEpoch]
+        except KeyError:
+            pass
+
+        qdt = QDateTime.fromSecsSinceEpoch(secsSinceEpoch)
+        text = locale.toString(qdt, settings.prefs.shortTimeFormat)
+        self.dateTextCache[secsSinceEpoch] = text
+        trimCacheDict(self.dateTextCache, DATE_TEXT_CACHE_SIZE)
+        return text
+
+    def commitSummary(self, commit: Commit) -> str:
+        """ Get the first line of a commit's message, cached by commit ID """
+        # Commits are immutable, so this cache doesn't need to be flushed when prefs change.
+        oid = commit.id
+        try:
+            return self.summaryCache[oid]
+        except KeyError:
+            pass
+
+        summary = messageSummary(commit.message, ELISION)[0]
+        self.summaryCache[oid] = summary
+        trimCacheDict(self.summaryCache, SUMMARY_CACHE_SIZE)
+        return summary
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         painter.save()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -162,12 +199,12 @@ class CommitLogDelegate(QStyledItemDelegate):
             author = commit.author
             committer = commit.committer
 
-            summaryText, contd = messageSummary(commit.message, ELISION)
-            hashText = shortHash(commit.id)
+            summaryText = self.commitSummary(commit)
+            # Same as shortHash(), minus its function-local import (this runs for every painted row)
+            hashText = str(oid)[:settings.prefs.shortHashChars]
             authorText = abbreviatePerson(author, settings.prefs.authorDisplayStyle)
 
-            qdt = QDateTime.fromSecsSinceEpoch(author.time)
-            dateText = option.locale.toString(qdt, settings.prefs.shortTimeFormat)
+            dateText = self.formatDate(author.time, option.locale)
 
             if settings.prefs.authorDiffAsterisk:
                 if author.email != committer.email:
@@ -434,7 +471,15 @@ class CommitLogDelegate(QStyledItemDelegate):
         painter.drawText(option.rect, Qt.AlignmentFlag.AlignVCenter, text)
 
     def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        # All rows have the same height (the view uses uniform item sizes),
+        # so only go through the base implementation when the font or the
+        # row height setting change.
         mult = settings.prefs.graphRowHeight
-        r = super().sizeHint(option, index)
-        r.setHeight(option.fontMetrics.height() * mult // 100)
-        return r
+        fontHeight = option.fontMetrics.height()
+        key = (fontHeight, mult)
+        if key != self.sizeHintCacheKey:
+            r = super().sizeHint(option, index)
+            r.setHeight(fontHeight * mult // 100)
+            self.sizeHintCache = r
+            self.sizeHintCacheKey = key
+        return QSize(self.sizeHintCache)
@@ -47,6 +47,7 @@ class CommitLogModel(QAbstractListModel):
 
     _authorColumnX: int
     _toolTipZones: dict[int, list[CommitToolTipZone]]
+    _authorToolTips: dict[Oid, str]
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -54,6 +55,7 @@ class CommitLogModel(QAbstractListModel):
         self._extraRow = SpecialRow.Invalid
         self._authorColumnX = -1
         self._toolTipZones = {}
+        self._authorToolTips = {}
 
     @property
     def isValid(self):
@@ -62,8 +64,13 @@ class CommitLogModel(QAbstractListModel):
     def clear(self):
         self.setCommitSequence([])
         self._toolTipZones.clear()
+        self.invalidateAuthorToolTips()
         self._extraRow = SpecialRow.Invalid
 
+    def invalidateAuthorToolTips(self):
+        """ Drop cached tooltips, e.g. after a change in language or date format """
+        self._authorToolTips.clear()
+
     def setCommitSequence(self, newCommitSequence: list[Commit]):
         self.beginResetModel()
         self._commitSequence = newCommitSequence
@@ -74,14 +81,22 @@ class CommitLogModel(QAbstractListModel):
 
         self._commitSequence = newCommitSequence
 
+        # Same number of rows at the top of the graph (e.g. amending HEAD):
+        # the row count doesn't change, so a single dataChanged over the
+        # spliced range is much cheaper than removing and reinserting rows.
+        if nRemovedRows == nAddedRows:
+            if nAddedRows != 0:
+                self.dataChanged.emit(self.index(0), self.index(nAddedRows - 1))
+            return
+
         # DON'T interleave beginRemoveRows/beginInsertRows!
         # It'll crash with QSortFilterProxyModel!
         if nRemovedRows != 0:
-            self.beginRemoveRows(parent, 0, nRemovedRows)
+            self.beginRemoveRows(parent, 0, nRemovedRows - 1)
             self.endRemoveRows()
 
         if nAddedRows != 0:
-            self.beginInsertRows(parent, 0, nAddedRows)
+            self.beginInsertRows(parent, 0, nAddedRows - 1)
             self.endInsertRows()
 
     def rowCount(self, *args, **kwargs) -> int:
@@ -99,14 +114,16 @@ class CommitLogModel(QAbstractListModel):
 
         row = index.row()
 
-        if role == Qt.ItemDataRole.DisplayRole:
-            return None
-
-        elif role == CommitLogModel.Role.Commit:
+        # Commit is by far the most frequently queried role (once per row
+        # per paint, plus searches), so test for it before anything else.
+        if role == CommitLogModel.Role.Commit:
             try:
                 return self._commitSequence[row]
             except IndexError:
-                pass
+                return None
+
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return None
 
         elif role == CommitLogModel.Role.Oid:
             try:
@@ -144,11 +161,11 @@ class CommitLogModel(QAbstractListModel):
                 elif zone.kind == "message":
                     tip = commitMessageTooltip(commit)
                 elif zone.kind == "author":
-                    tip = commitAuthorTooltip(commit)
+                    tip = self.authorToolTip(commit)
                 break
 
             if self._authorColumnX <= 0:  # author hidden in narrow window
-                tip += commitAuthorTooltip(commit)
+                tip += self.authorToolTip(commit)
 
             return tip
 
@@ -172,6 +189,19 @@ class CommitLogModel(QAbstractListModel):
 
         return False
 
+    def authorToolTip(self, commit: Commit) -> str:
+        """ Get author/committer tooltip markup for a commit, cached by commit ID """
+        oid = commit.id
+        try:
+            return self._authorToolTips[oid]
+        except KeyError:
+            pass
+
+        markup = commitAuthorTooltip(commit)
+        self._authorToolTips[oid] = markup
+        trimCacheDict(self._authorToolTips, CommitLogModel.ToolTipCacheSize)
+        return markup
+
 
 def commitAuthorTooltip(commit: Commit) -> str:
     def formatTime(sig: Signature):
@@ -248,11 +248,13 @@ class GraphView(QListView):
             locator = NavLocator(NavContext.EMPTY)
         else:
             special = current.data(CommitLogModel.Role.SpecialRow)
-            if special == SpecialRow.UncommittedChanges:
-                locator = NavLocator(NavContext.WORKDIR)
-            elif special == SpecialRow.Commit:
+            # Test for regular commits first: that's what we get when the user
+            # is scrolling through the log with the arrow keys.
+            if special == SpecialRow.Commit:
                 oid = current.data(CommitLogModel.Role.Oid)
                 locator = NavLocator(NavContext.COMMITTED, commit=oid)
+            elif special == SpecialRow.UncommittedChanges:
+                locator = NavLocator(NavContext.WORKDIR)
             else:
                 locator = NavLocator(NavContext.SPECIAL, path=str(special))
         Jump.invoke(self, locator)
@@ -311,6 +313,7 @@ class GraphView(QListView):
         # Force redraw to reflect changes in row height, flattening, date format, etc.
         if invalidateMetrics:
             self.itemDelegate().invalidateMetrics()
+            self.clModel.invalidateAuthorToolTips()
             self.model().layoutChanged.emit()
 
     # -------------------------------------------------------------------------
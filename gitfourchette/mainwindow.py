@@ -49,6 +49,7 @@ class MainWindow(QMainWindow):
     tabs: QTabWidget2
 
     recentMenu: QMenu
+    recentMenuContents: list[tuple[str, str]] | None
     repoMenu: QMenu
     showStatusBarAction: QAction
     showMenuBarAction: QAction
@@ -355,6 +356,7 @@ class MainWindow(QMainWindow):
         recentAction.setMenu(self.recentMenu)
         self.recentMenu.setObjectName("RecentMenu")
         self.recentMenu.setToolTipsVisible(True)
+        self.recentMenuContents = None  # force fresh menu to be populated
         self.fillRecentMenu()
 
         self.autoHideMenuBar.reconnectToMenus()
@@ -365,9 +367,17 @@ class MainWindow(QMainWindow):
             settings.history.write()
             self.fillRecentMenu()
 
+        recents = [(path, settings.history.getRepoNickname(path, strict=True))
+                   for path in settings.history.getRecentRepoPaths(settings.prefs.maxRecentRepos)]
+
+        # This is called every time a repo is loaded; don't tear down and
+        # recreate all the actions if the list hasn't changed.
+        if recents == self.recentMenuContents:
+            return
+        self.recentMenuContents = recents
+
         self.recentMenu.clear()
-        for path in settings.history.getRecentRepoPaths(settings.prefs.maxRecentRepos):
-            nickname = settings.history.getRepoNickname(path, strict=True)
+        for path, nickname in recents:
             caption = compactPath(path)
             if nickname:
                 caption += f" ({tquo(nickname)})"
@@ -7,28 +7,77 @@
 import base64
 import dataclasses
 import enum
+import functools
 import json
 import logging
 import os
 import typing
+from collections.abc import Callable
+from contextlib import suppress
 from types import NoneType, UnionType
 from typing import Any
 
 from gitfourchette import pycompat  # noqa: F401 - StrEnum for Python 3.10
 from gitfourchette.porcelain import *
-from gitfourchette.qt import *
+from gitfourchette.qt import QStandardPaths, QTimer, qTempDir
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+def dumpJson(obj: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, with orjson's C encoder if it's installed.
+
+    Both backends write the whole object on a single line, so a hand-edited
+    prefs file loses its indentation the next time the app saves it.
+
+    orjson is stricter than the json module (e.g. it rejects integers beyond
+    64 bits), so fall back to the json module if orjson refuses the object.
+    """
+    if orjson:
+        with suppress(orjson.JSONEncodeError):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loadJson(data: bytes) -> Any:
+    """ Parse UTF-8 JSON, with orjson's C decoder if it's installed. Raises ValueError on bad input. """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclasses.dataclass
+class _PrefsClassMeta:
+    # Field name -> default value. The values are shared between all instances,
+    # so they're only fit for comparison, not for assignment.
+    defaults: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    # Field name -> (srcType, construct) arguments for PrefsFile.decode (see getDecoder)
+    decoders: dict[str, tuple[type, Callable | None]] = dataclasses.field(default_factory=dict)
+
 
 class PrefsFile:
     _filename = ""
     _allowMakeDirs = True
+    _writeScheduled = False
 
     def getParentDir(self) -> str:
         from gitfourchette.settings import TEST_MODE
         if TEST_MODE:
             return os.path.join(qTempDir(), "testmode-config")
+        return PrefsFile._appConfigLocation()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _appConfigLocation() -> str:
+        # Resolved once per process: the application name (which this depends on)
+        # is set up before any prefs file is touched.
         return QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation)
 
     def _getFullPath(self, forWriting: bool) -> str:
@@ -60,6 +109,23 @@ class PrefsFile:
         except AttributeError:
             return False
 
+    def scheduleWrite(self, delayMs: int = 500):
+        """
+        Mark the file as dirty and write it out shortly, coalescing bursts of
+        changes (e.g. restoring a session with many tabs) into a single write.
+        """
+        self.setDirty()
+        if self._writeScheduled:
+            return
+        self._writeScheduled = True
+        QTimer.singleShot(delayMs, self._flushScheduledWrite)
+
+    def _flushScheduledWrite(self):
+        self._writeScheduled = False
+        # Someone may have written the file in the meantime (e.g. when the session ends)
+        if self.isDirty():
+            self.write()
+
     def reset(self):
         assert dataclasses.is_dataclass(self)
         for f in dataclasses.fields(self):
@@ -68,6 +134,7 @@ class PrefsFile:
             else:
                 obj = f.default
             self.__dict__[f.name] = obj
+        self._writeScheduled = False
 
     def write(self, force=False) -> str:
         # Prepare the path
@@ -76,29 +143,13 @@ class PrefsFile:
             logger.warning("Couldn't get path for writing")
             return ""
 
-        # Filter the values
+        # Skip default values and make the rest JSON-friendly
         assert dataclasses.is_dataclass(self)
-        fields: dict[str, dataclasses.Field] = self.__dataclass_fields__
-        filtered = {}
-        for key, field in fields.items():
-            # Skip private fields
-            if key.startswith("_"):
-                continue
-
-            if field.default_factory != dataclasses.MISSING:
-                default = field.default_factory()
-            else:
-                default = field.default
-
-            value = self.__dict__[key]
-
-            # Skip default values
-            if value == default:
-                continue
-
-            # Make the value JSON-friendly
-            value = self.encode(value)
-            filtered[key] = value
+        values = self.__dict__
+        encode = self.encode
+        filtered = {key: encode(value)
+                    for key, default in self._classMeta().defaults.items()
+                    if (value := values[key]) != default}
 
         # If the filtered object comes out empty (all defaults)
         # avoid cluttering the directory - don't write out an empty object
@@ -111,9 +162,20 @@ class PrefsFile:
                 os.unlink(prefsPath)
             return ""
 
-        # Dump the object to disk
-        with open(prefsPath, "w", encoding="utf-8") as jsonFile:
-            json.dump(obj=filtered, fp=jsonFile, indent='\t')
+        # Dump the object to a temporary file, then atomically move it into place
+        # so that a crash mid-write can't leave behind a truncated prefs file
+        tempPath = prefsPath + ".tmp"
+        try:
+            with open(tempPath, "wb") as jsonFile:
+                jsonFile.write(dumpJson(filtered))
+                jsonFile.flush()
+                os.fsync(jsonFile.fileno())
+            os.replace(tempPath, prefsPath)
+        except BaseException:
+            # Don't leave a half-written temp file behind in the config directory
+            with suppress(OSError):
+                os.unlink(tempPath)
+            raise
         self._dirty = False
 
         logger.info(f"Wrote {prefsPath}")
@@ -125,26 +187,27 @@ class PrefsFile:
             return False
 
         # Load JSON blob
-        with open(prefsPath, encoding="utf-8") as file:
+        with open(prefsPath, "rb") as file:
             try:
-                jsonObject = json.load(file)
+                jsonObject = loadJson(file.read())
             except ValueError as loadError:
                 logger.warning(f"{prefsPath}: {loadError}", exc_info=True)
                 return False
 
-        assert dataclasses.is_dataclass(self)
-        fields: dict[str, dataclasses.Field] = self.__dataclass_fields__
+        decoders = self._classMeta().decoders
 
         # Decode values and store them in this object
         for key, value in jsonObject.items():
-            if key.startswith('_') or key not in fields:
+            try:
+                srcType, construct = decoders[key]
+            except KeyError:
                 logger.warning(f"{prefsPath}: dropping key: {key}")
                 continue
             if value is None:
                 continue
 
             try:
-                value = self.decode(value, fields[key].type)
+                value = self.decode(value, srcType, construct)
             except ValueError as error:
                 logger.warning(f"{prefsPath}: {key}: {error}")
                 continue
@@ -154,6 +217,41 @@ class PrefsFile:
         self._dirty = False
         return True
 
+    @classmethod
+    def _classMeta(cls) -> _PrefsClassMeta:
+        """
+        Describe the public fields of this class (see _PrefsClassMeta).
+        Built from the dataclass declaration the first time it's needed,
+        so that write() and load() don't have to introspect fields every time.
+        """
+        # Look in the class's own __dict__ so subclasses don't inherit their parent's metadata
+        try:
+            return cls.__dict__["_meta"]
+        except KeyError:
+            pass
+
+        assert dataclasses.is_dataclass(cls)
+        meta = _PrefsClassMeta()
+        for name, field in cls.__dataclass_fields__.items():
+            if name.startswith("_"):
+                continue
+
+            if field.default_factory != dataclasses.MISSING:
+                meta.defaults[name] = field.default_factory()
+            else:
+                meta.defaults[name] = field.default
+
+            fieldType = field.type
+            # Extract type from "SomeType | None" unions
+            if type(fieldType) is UnionType:
+                union = typing.get_args(fieldType)
+                assert len(union) == 2
+                fieldType = next(t for t in union if t is not NoneType)
+            meta.decoders[name] = cls.getDecoder(fieldType)
+
+        cls._meta = meta
+        return meta
+
     @staticmethod
     def encode(o: Any) -> Any:
         """ Encode a value to make it JSON-friendly """
@@ -168,39 +266,32 @@ class PrefsFile:
         return o
 
     @staticmethod
-    def decode(o: Any, dstType: type | UnionType) -> Any:
-        """ Convert a value coming from a JSON blob to a target type """
-        construct = None
-
-        # Extract type from "SomeType | None" unions
-        if type(dstType) is UnionType:
-            union = typing.get_args(dstType)
-            assert len(union) == 2
-            dstType = next(t for t in union if t is not NoneType)
-
+    def getDecoder(dstType: type) -> tuple[type, Callable | None]:
+        """
+        Return the JSON type that stands for a field's type,
+        and a function that converts from the former to the latter.
+        The function is None if JSON values can be used as-is.
+        """
         if dstType is bytes:
-            srcType = str
-            construct = base64.b64decode
+            return str, base64.b64decode
         elif dstType is set:
-            srcType = list
+            return list, set
         elif issubclass(dstType, enum.StrEnum):
-            srcType = str
+            return str, dstType
         elif issubclass(dstType, enum.IntEnum | enum.Enum):
-            srcType = int
+            return int, dstType
         elif dstType is Signature:
-            srcType = dict
-            construct = PrefsFile.decodeSignature
+            return dict, PrefsFile.decodeSignature
         else:
-            srcType = dstType
+            return dstType, None
 
-        if srcType is not dstType:
+    @staticmethod
+    def decode(o: Any, srcType: type, construct: Callable | None) -> Any:
+        """ Convert a value coming from a JSON blob (see getDecoder) """
+        if construct is not None:
             if not isinstance(o, srcType):
                 raise ValueError("unexpected JSON field type")
-            if construct is not None:
-                o = construct(o)
-            else:
-                o = dstType(o)
-
+            o = construct(o)
         return o
 
     @staticmethod
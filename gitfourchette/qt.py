@@ -16,6 +16,9 @@
 # If you're packaging the app, you may prefer to force a binding via appconsts.py.
 
 from contextlib import suppress as _suppress
+from functools import partial as _partial
+import importlib as _importlib
+from importlib.util import find_spec as _findSpec
 import logging as _logging
 import json as _json
 import os as _os
@@ -46,8 +49,8 @@ if not _qtBindingBootPref:
     if _sys.platform == "darwin":
         _prefsPath = _os.path.expanduser("~/Library/Preferences")
     else:
-        _prefsPath = _os.environ.get("XDG_CONFIG_HOME", _os.path.expanduser("~/.config"))
-    _prefsPath = _os.path.join(_prefsPath, APP_SYSTEM_NAME, "prefs.json")
+        _prefsPath = _os.environ.get("XDG_CONFIG_HOME") or _os.path.expanduser("~/.config")
+    _prefsPath = f"{_prefsPath}/{APP_SYSTEM_NAME}/prefs.json"
     with _suppress(OSError, ValueError):
         with open(_prefsPath, encoding="utf-8") as _f:
             _jsonPrefs = _json.load(_f)
@@ -113,53 +116,62 @@ if not QT_BINDING:
 # Set up platform constants
 
 QT_BINDING_BOOTPREF = _qtBindingBootPref
-KERNEL = QSysInfo.kernelType().lower()
-MACOS = KERNEL == "darwin"
-WINDOWS = KERNEL == "winnt"
+# sys.platform tells us as much as QSysInfo.kernelType() without calling into Qt
+# (it may carry a version suffix on BSDs, e.g. "freebsd14")
+MACOS = _sys.platform == "darwin"
+WINDOWS = _sys.platform == "win32"
+KERNEL = "winnt" if WINDOWS else _sys.platform.rstrip("0123456789")
 FREEDESKTOP = (KERNEL == "linux") or ("bsd" in KERNEL)
 
 # -----------------------------------------------------------------------------
-# Try to import optional modules
+# Optional modules, loaded on first access (see __getattr__ below)
 
 # Test mode stuff
-QAbstractItemModelTester = None
-QTest = None
-QSignalSpy = None
-with _suppress(ImportError):
-    if PYQT6:
-        from PyQt6.QtTest import QAbstractItemModelTester, QTest, QSignalSpy
-    elif PYQT5:
-        from PyQt5.QtTest import QAbstractItemModelTester, QTest, QSignalSpy
-    elif PYSIDE6:
-        from PySide6.QtTest import QAbstractItemModelTester, QTest, QSignalSpy
-
-# Try to import QtDBus on Linux
+_lazyQtTestNames = {"QAbstractItemModelTester", "QTest", "QSignalSpy"}
+
+# QtDBus is only used on Linux. Just check that it's there without loading it.
 HAS_QTDBUS = False
 if FREEDESKTOP:
     with _suppress(ImportError):
-        if PYSIDE6:
-            from PySide6.QtDBus import *
-        elif PYQT6:
-            from PyQt6.QtDBus import *
-        elif PYQT5:
-            from PyQt5.QtDBus import *
-        else:
-            raise ImportError("QtDBus")
-        HAS_QTDBUS = True
+        HAS_QTDBUS = _findSpec(f"{QT_BINDING}.QtDBus") is not None
+
+
+def __getattr__(name: str):
+    """
+    Import QtTest and QtDBus names on demand. Since star imports skip these names,
+    import them explicitly: "from gitfourchette.qt import QTest".
+    QtTest names resolve to None if QtTest isn't available.
+    QtDBus names raise ImportError if QtDBus is present but fails to load.
+    """
+    global HAS_QTDBUS
+
+    if name in _lazyQtTestNames:
+        submodule = "QtTest"
+    elif name.startswith("QDBus") and HAS_QTDBUS:
+        submodule = "QtDBus"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(_importlib.import_module(f"{QT_BINDING}.{submodule}"), name)
+    except ImportError:
+        if submodule != "QtTest":
+            # QtDBus was found but won't load. Stop advertising it.
+            HAS_QTDBUS = False
+            raise
+        value = None
+
+    globals()[name] = value
+    return value
 
 # -----------------------------------------------------------------------------
-# Exclude some known bad PySide6 versions
+# Known bad PySide6 versions (see checkPySide6Version)
 
-if PYSIDE6:
-    _badPyside6Versions = [
-        "6.4.0",  # PYSIDE-2104
-        "6.4.0.1",  # PYSIDE-2104
-        "6.5.1",  # PYSIDE-2346
-    ]
-    if any(v == QT_BINDING_VERSION for v in _badPyside6Versions):
-        QApplication()
-        QMessageBox.critical(None, "", f"PySide6 version {QT_BINDING_VERSION} isn't supported.\nPlease upgrade to the latest version of PySide6.")
-        _sys.exit(1)
+_badPyside6Versions = frozenset({
+    "6.4.0",  # PYSIDE-2104
+    "6.4.0.1",  # PYSIDE-2104
+    "6.5.1",  # PYSIDE-2346
+})
 
 # -----------------------------------------------------------------------------
 # Patch some holes and incompatibilities in Qt bindings
@@ -192,12 +204,10 @@ if QT5:
 # -----------------------------------------------------------------------------
 # Utility functions
 
-def tr(s, *args, **kwargs):
-    return QCoreApplication.translate("", s, *args, **kwargs)
-
-
-def translate(context, s, *args, **kwargs):
-    return QCoreApplication.translate(context, s, *args, **kwargs)
+# translate(context, s, ...) and tr(s, ...) are called a lot while building the UI,
+# so bind them straight to Qt instead of going through Python wrappers.
+translate = QCoreApplication.translate
+tr = _partial(translate, "")
 
 
 def qAppName():
@@ -205,6 +215,17 @@ def qAppName():
     return QApplication.applicationDisplayName()
 
 
+def checkPySide6Version():
+    """
+    Exit the app if it's running on a known bad version of PySide6.
+    Call this once the QApplication exists, so that we can show an error message
+    without having to boot up the GUI at import time.
+    """
+    if PYSIDE6 and QT_BINDING_VERSION in _badPyside6Versions:
+        QMessageBox.critical(None, "", f"PySide6 version {QT_BINDING_VERSION} isn't supported.\nPlease upgrade to the latest version of PySide6.")
+        _sys.exit(1)
+
+
 def qTempDir():
     """ Path to temporary directory for this session. """
     return QApplication.instance().tempDir.path()
@@ -7,6 +7,7 @@
 from contextlib import suppress
 import dataclasses
 import enum
+import heapq
 import logging
 import os
 import shlex
@@ -14,7 +15,7 @@ import sys
 
 from gitfourchette import pycompat  # noqa: F401 - StrEnum for Python 3.10
 from gitfourchette.prefsfile import PrefsFile
-from gitfourchette.qt import *
+from gitfourchette.qt import MACOS, WINDOWS, Qt, QAbstractItemView, QStandardPaths, tr
 from gitfourchette.toolbox.benchmark import BENCHMARK_LOGGING_LEVEL
 from gitfourchette.toolbox.gitutils import AuthorDisplayStyle
 from gitfourchette.toolbox.pathutils import PathDisplayStyle
@@ -322,10 +323,10 @@ class History(PrefsFile):
         self.invalidateSequenceNumber()
 
     def getRecentRepoPaths(self, n: int, newestFirst=True):
-        sortedPaths = (path for path, _ in
-                       sorted(self.repos.items(), key=lambda i: i[1].get('seq', -1), reverse=newestFirst))
-
-        return (path for path, _ in zip(sortedPaths, range(n), strict=False))
+        # Partial sort - we only need the top n entries, not the entire history in order
+        pick = heapq.nlargest if newestFirst else heapq.nsmallest
+        topItems = pick(n, self.repos.items(), key=lambda i: i[1].get('seq', -1))
+        return (path for path, _ in topItems)
 
     def write(self, force=False):
         self.trim()
@@ -214,10 +214,13 @@ class SidebarModel(QAbstractItemModel):
 
         self.clear()
 
-        if settings.DEVDEBUG and QAbstractItemModelTester is not None:
-            self.modelTester = QAbstractItemModelTester(self)
-            if not settings.TEST_MODE:
-                logger.warning("Sidebar model tester enabled. This will SIGNIFICANTLY slow down SidebarModel.rebuild!")
+        if settings.DEVDEBUG:
+            # QtTest is loaded on demand, so star imports skip it
+            from gitfourchette.qt import QAbstractItemModelTester
+            if QAbstractItemModelTester is not None:
+                self.modelTester = QAbstractItemModelTester(self)
+                if not settings.TEST_MODE:
+                    logger.warning("Sidebar model tester enabled. This will SIGNIFICANTLY slow down SidebarModel.rebuild!")
 
     def clear(self, emitSignals=True):
         # IMPORTANT: Do not clear collapseCache in this function!
@@ -76,15 +76,16 @@ class PrimeRepo(RepoTask):
         #       See also https://github.com/libgit2/libgit2/blob/main/include/git2/config.h#L42
         repo.config.add_file(sessionwideConfigPath, level=-1)
 
-        # Create RepoModel
-        repoModel = RepoModel(repo)
-        self.setRepoModel(repoModel)  # required to execute subtasks later
-
         # ---------------------------------------------------------------------
         # EXIT UI THREAD
         # ---------------------------------------------------------------------
         yield from self.flowEnterWorkerThread()
 
+        # Create RepoModel (loads repo prefs, refs, stashes, submodules, remotes
+        # from disk - keep this off the UI thread so the progress widget stays live)
+        repoModel = RepoModel(repo)
+        self.setRepoModel(repoModel)  # required to execute subtasks later
+
         locale = QLocale()
 
         # Prime the walker (this might take a while)
@@ -178,7 +179,7 @@ class PrimeRepo(RepoTask):
         # Bump repo in history
         settings.history.addRepo(repo.workdir)
         settings.history.setRepoSuperproject(repo.workdir, repoModel.superproject)
-        settings.history.write()
+        settings.history.scheduleWrite()
         rw.window().fillRecentMenu()  # TODO: emit signal instead?
 
         # Finally, prime the UI.
@@ -81,9 +81,10 @@ def stockIcon(iconId: str, colorRemapTable="") -> QIcon:
     else:
         key = iconId
 
-    # Attempt to get cached icon
-    if key in _stockIconCache:
-        return _stockIconCache[key]
+    # Attempt to get cached icon (single dict probe - this is called from paint handlers)
+    icon = _stockIconCache.get(key, None)
+    if icon is not None:
+        return icon
 
     if colorRemapTable:
         try:
@@ -5,6 +5,7 @@
 # -----------------------------------------------------------------------------
 
 import enum
+import functools
 import os
 
 HOME = os.path.abspath(os.path.expanduser('~'))
@@ -17,8 +18,19 @@ class PathDisplayStyle(enum.IntEnum):
 
 
 def compactPath(path: str) -> str:
+    # Relative paths depend on the cwd, so only memoize absolute paths.
+    if not os.path.isabs(path):
+        return _compactNormalizedPath(os.path.abspath(path))
+    return _compactAbsPath(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _compactAbsPath(path: str) -> str:
     # Normalize path first, which also turns forward slashes to backslashes on Windows.
-    path = os.path.abspath(path)
+    return _compactNormalizedPath(os.path.abspath(path))
+
+
+def _compactNormalizedPath(path: str) -> str:
     if path.startswith(HOME):
         path = "~" + path[len(HOME):]
     return path
@@ -23,6 +23,34 @@ def openFolder(path: str):
     QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
 
+def _showInFolderDBus(path: str) -> bool:  # pragma: no cover (platform-specific)
+    # https://www.freedesktop.org/wiki/Specifications/file-manager-interface
+    try:
+        # QtDBus is loaded on demand, so star imports skip it
+        from gitfourchette.qt import QDBusArgument, QDBusInterface
+    except ImportError:
+        # QtDBus is installed but won't load (missing libdbus, ABI mismatch...)
+        return False
+
+    iface = QDBusInterface("org.freedesktop.FileManager1", "/org/freedesktop/FileManager1")
+    if not iface.isValid():
+        return False
+
+    if PYQT5 or PYQT6:
+        # PyQt5/6 needs the array of strings to be spelled out explicitly.
+        stringType = QMetaType.Type.QString
+        args = QDBusArgument()
+        args.beginArray(stringType if PYQT5 else stringType.value)
+        args.add(path)
+        args.endArray()
+    else:
+        # Thankfully, PySide6 is more pythonic here.
+        args = [path]
+    iface.call("ShowItems", args, "")
+    iface.deleteLater()
+    return True
+
+
 def showInFolder(path: str):  # pragma: no cover (platform-specific)
     """
     Show a file or folder with explorer/finder.
@@ -32,21 +60,7 @@ def showInFolder(path: str):  # pragma: no cover (platform-specific)
     isdir = os.path.isdir(path)
 
     if FREEDESKTOP and HAS_QTDBUS:
-        # https://www.freedesktop.org/wiki/Specifications/file-manager-interface
-        iface = QDBusInterface("org.freedesktop.FileManager1", "/org/freedesktop/FileManager1")
-        if iface.isValid():
-            if PYQT5 or PYQT6:
-                # PyQt5/6 needs the array of strings to be spelled out explicitly.
-                stringType = QMetaType.Type.QString
-                args = QDBusArgument()
-                args.beginArray(stringType if PYQT5 else stringType.value)
-                args.add(path)
-                args.endArray()
-            else:
-                # Thankfully, PySide6 is more pythonic here.
-                args = [path]
-            iface.call("ShowItems", args, "")
-            iface.deleteLater()
+        if _showInFolderDBus(path):
             return
 
     elif WINDOWS:
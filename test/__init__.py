@@ -27,3 +27,4 @@ else:
 os.environ["FORCE_QT_API"] = "1"
 
 from gitfourchette.qt import *  # noqa: E402 - intentionally importing Qt at this specific point
+from gitfourchette.qt import QSignalSpy, QTest  # noqa: E402 - QtTest is loaded on demand, so star imports skip it
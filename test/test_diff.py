@@ -266,6 +266,8 @@ def testSearchInDiff(tempDir, mainWindow):
     assert searchBar.isVisibleTo(rw)
 
     QTest.keyClicks(searchLine, "master")
+    assert diffView.highlighter.searchTerm == "master"
+    assert diffView.highlighter.document() is diffView.document()
     searchNext.click()
     forward1 = diffView.textCursor()
     assert forward1.selectedText() == "master"
@@ -312,6 +314,11 @@ def testSearchInDiff(tempDir, mainWindow):
     # Reject last message box to prevent wrapping again
     rejectQMessageBox(rw, "no.+occurrence.+of.+MadeUpGarbage.+found")
 
+    # Hiding the search bar turns off search term highlighting
+    searchBar.hide()
+    assert diffView.highlighter.searchTerm == ""
+    assert diffView.highlighter.document() is None
+
 
 def testCopyFromDiffWithoutU2029(tempDir, mainWindow):
     """
@@ -702,3 +709,24 @@ def testRevertHunk(tempDir, mainWindow):
 
     assert NavLocator.inUnstaged("c/c1.txt").isSimilarEnoughTo(rw.navLocator)
     assert readFile(f"{wd}/c/c1.txt") == b"c1\n"
+
+
+def testSelectWholeHunkFromHeader(tempDir, mainWindow):
+    wd = unpackRepo(tempDir)
+    writeFile(f"{wd}/master.txt", "".join(f"line {i}\n" for i in range(1, 41)))
+    with RepoContext(wd) as repo:
+        repo.index.add("master.txt")
+        repo.create_commit_on_head("forty lines", TEST_SIGNATURE, TEST_SIGNATURE)
+    writeFile(f"{wd}/master.txt", "".join(f"line {i}\n" if i not in (2, 38) else "changed\n" for i in range(1, 41)))
+    rw = mainWindow.openRepo(wd)
+    dv = rw.diffView
+
+    qlvClickNthRow(rw.dirtyFiles, 0)
+    assert len(re.findall(r"^@@ ", dv.toPlainText(), re.M)) == 2
+
+    # Selecting the first hunk header selects that entire hunk, but not the next one
+    dv.selectClumpOfLinesAt(textCursorPosition=0)
+    selectedLines = dv.textCursor().selectedText().split(" ")
+    assert selectedLines[0].startswith("@@ -1,5 +1,5 @@")
+    assert selectedLines[-1] == "line 5"
+    assert not any("line 38" in line for line in selectedLines)
@@ -4,6 +4,9 @@
 # For full terms, see the included LICENSE file.
 # -----------------------------------------------------------------------------
 
+import pytest
+
+from gitfourchette import prefsfile
 from gitfourchette.forms.prefsdialog import PrefsDialog
 from gitfourchette.nav import NavLocator
 from .util import *
@@ -144,3 +147,32 @@ def testPrefsRecreateDiffDocument(tempDir, mainWindow):
 
     assert rw.navLocator.isSimilarEnoughTo(NavLocator.inUnstaged("crlf.txt"))
     assert "<CRLF>" not in rw.diffView.toPlainText()
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def testPrefsFileRoundTrip(tempDir, monkeypatch, backend):
+    from gitfourchette.settings import History, Prefs, Session
+    from gitfourchette.toolbox import PathDisplayStyle
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(prefsfile, "orjson", None)
+    monkeypatch.setattr(prefsfile.PrefsFile, "getParentDir", lambda self: tempDir.name)
+
+    prefs = Prefs(language="fr_FR", pathDisplayStyle=PathDisplayStyle.SHOW_FILENAME_ONLY)
+    history = History(repos={"/tmp/héhé": {"seq": 2**70}, 123: {}}, cloneHistory=["https://example.com"], startups=3)
+    session = Session(tabs=["/a", "/b"], activeTabIndex=1, windowGeometry=b"\x00\xffgeometry", splitterSizes={"x": [1, 2]})
+
+    for original in [prefs, history, session]:
+        original.write()
+        reloaded = type(original)()
+        assert reloaded.load()
+        if original is history:
+            # Like the json module, non-string keys come back as strings
+            original.repos["123"] = original.repos.pop(123)
+        assert reloaded == original
+
+        # Compact output, on a single line
+        with open(os.path.join(tempDir.name, original._filename), "rb") as f:
+            assert b"\n" not in f.read()